@@ -0,0 +1,48 @@
+"""Authenticated debug routes for on-demand profiling."""
+
+from __future__ import annotations
+
+import hmac
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import Settings
+from app.core.profiling import ProfilerBusy, format_collapsed, sample_cpu, snapshot_allocations
+
+router = APIRouter(prefix="/debug")
+settings = Settings()
+
+
+def require_debug_token(x_debug_token: Optional[str] = Header(None)) -> None:
+    """Reject callers without the configured debug token; hide routes when unset."""
+    if not settings.debug_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_debug_token is None or not hmac.compare_digest(
+        x_debug_token.encode(), settings.debug_token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid debug token")
+
+
+@router.get("/profile", dependencies=[Depends(require_debug_token)])
+def profile(
+    mode: Literal["cpu", "alloc"] = "cpu",
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    top: int = Query(25, ge=1, le=500),
+    idle: bool = False,
+):
+    """
+    Profile live traffic for the requested duration.
+
+    cpu returns collapsed stacks (flamegraph-ready), excluding threads parked in
+    idle waits unless idle=true; alloc returns top allocation sites.
+    """
+    try:
+        if mode == "cpu":
+            stacks = sample_cpu(seconds=seconds, interval=interval_ms / 1000.0, idle=idle)
+            return PlainTextResponse(format_collapsed(stacks))
+        return {"allocations": snapshot_allocations(seconds=seconds, top=top)}
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
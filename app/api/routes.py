@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
+from app.core.admission import AdmissionController, AdmissionRejected
 from app.core.config import Settings
+from app.core.dedup import IdempotencyCache
 from app.core.metrics import MetricsEngine, MetricSnapshot
 from app.engine.demo_strategy import DemoStrategy
 from app.engine.executor import ExecutionEngine, PortfolioState
@@ -26,6 +31,11 @@ state.equity_peak = state.wallet_a.balance + state.wallet_b.balance
 metrics_engine = MetricsEngine(settings)
 executor = ExecutionEngine(state=state, settings=settings)
 strategy = DemoStrategy(executor=executor, settings=settings)
+admission = AdmissionController(settings)
+trade_cache = IdempotencyCache(settings)
+# Keys whose first submission is still executing, with the request fingerprint;
+# only touched on the event loop.
+_pending_trades: Dict[str, Tuple[str, "asyncio.Task[bytes]"]] = {}
 
 
 class WalletView(BaseModel):
@@ -61,9 +71,22 @@ class StatusResponse(BaseModel):
     recentTrades: List[TradeView]
 
 
+class EquityResponse(BaseModel):
+    totalPoints: int
+    timestamps: List[float]
+    walletA: List[float]
+    walletB: List[float]
+
+
 class TradeRequest(BaseModel):
     price: float = Field(..., gt=0)
     probability: float = Field(..., ge=0, le=1)
+    signal_time: Optional[datetime] = Field(
+        None, description="When the signal was generated; used for the admission deadline"
+    )
+    idempotency_key: Optional[str] = Field(
+        None, min_length=1, max_length=128, description="Repeats with the same key replay the first response"
+    )
 
 
 class TradeResponse(BaseModel):
@@ -73,6 +96,7 @@ class TradeResponse(BaseModel):
     price: float
     pnl: float
     message: str
+    reason: Optional[str] = None
 
 
 @router.get("/status", response_model=StatusResponse)
@@ -90,8 +114,90 @@ def get_status() -> StatusResponse:
 
 
 @router.post("/trade", response_model=TradeResponse)
-def run_trade(request: TradeRequest) -> TradeResponse:
-    """Run demo strategy once."""
+async def run_trade(request: TradeRequest):
+    """Run demo strategy once, replaying the original response for repeated keys."""
+    key = request.idempotency_key
+    if key is None:
+        return await _admit_and_execute(request)
+
+    fingerprint = _fingerprint(request)
+    cached = trade_cache.get(key)
+    if cached is not None:
+        _check_fingerprint(cached[0], fingerprint)
+        trade_cache.record_hit()
+        return _replay(cached[1])
+
+    pending = _pending_trades.get(key)
+    if pending is not None:
+        _check_fingerprint(pending[0], fingerprint)
+        try:
+            body = await asyncio.shield(pending[1])
+        except HTTPException:
+            # The first attempt was rejected before executing, so this retry runs on its own.
+            return await run_trade(request)
+        trade_cache.record_hit()
+        return _replay(body)
+
+    trade_cache.record_miss()
+    # The execution task outlives a cancelled request so a started trade is
+    # always cached and handed to waiters instead of being run again.
+    task = asyncio.ensure_future(_execute_once(key, fingerprint, request))
+    _pending_trades[key] = (fingerprint, task)
+    task.add_done_callback(lambda done: _forget_pending(key, done))
+    return _replay(await asyncio.shield(task))
+
+
+async def _execute_once(key: str, fingerprint: str, request: TradeRequest) -> bytes:
+    """Execute a keyed trade and cache its serialized response."""
+    response = await _admit_and_execute(request)
+    body = response.model_dump_json().encode()
+    trade_cache.put(key, fingerprint, body)
+    return body
+
+
+def _forget_pending(key: str, task: "asyncio.Task[bytes]") -> None:
+    _pending_trades.pop(key, None)
+    if not task.cancelled():
+        # Mark the outcome as retrieved even when no request is left to await it.
+        task.exception()
+
+
+def _fingerprint(request: TradeRequest) -> str:
+    payload = request.model_dump_json(exclude={"idempotency_key"}).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _check_fingerprint(expected: str, actual: str) -> None:
+    if expected != actual:
+        raise HTTPException(status_code=422, detail="Idempotency key reused with a different request")
+
+
+def _replay(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+async def _admit_and_execute(request: TradeRequest) -> TradeResponse:
+    """Shed requests that cannot be served on time, otherwise run the pipeline."""
+    try:
+        async with admission.admit(request.signal_time):
+            return await run_in_threadpool(_execute_trade, request)
+    except AdmissionRejected as exc:
+        if exc.kind == AdmissionRejected.QUEUE_FULL:
+            raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "1"}) from exc
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
+@router.get("/stats")
+def get_stats() -> dict:
+    """Return operational counters."""
+    return {
+        "admission": admission.stats(),
+        "idempotency": trade_cache.stats(),
+        "guards": strategy.policy.stats(),
+    }
+
+
+def _execute_trade(request: TradeRequest) -> TradeResponse:
     metrics = _snapshot()
     decision_result = strategy.run(price=request.price, probability=request.probability, metrics=metrics)
 
@@ -103,7 +209,12 @@ def run_trade(request: TradeRequest) -> TradeResponse:
             quantity=0.0,
             price=request.price,
             pnl=0.0,
-            message="Trade skipped due to guards or insufficient edge",
+            message=(
+                f"Trade skipped by guard: {decision_result.reason}"
+                if decision_result.reason
+                else "Trade skipped due to guards or insufficient edge"
+            ),
+            reason=decision_result.reason,
         )
 
     try:
@@ -124,6 +235,18 @@ def run_trade(request: TradeRequest) -> TradeResponse:
     )
 
 
+@router.get("/equity", response_model=EquityResponse)
+def get_equity(points: int = Query(500, ge=2, le=5000)) -> EquityResponse:
+    """Return the equity curve downsampled to at most `points` samples (epoch seconds)."""
+    curve = state.equity_curve.downsample(points)
+    return EquityResponse(
+        totalPoints=curve.total_points,
+        timestamps=curve.timestamps,
+        walletA=curve.wallet_a,
+        walletB=curve.wallet_b,
+    )
+
+
 @router.post("/reset")
 def reset_day() -> dict:
     """Reset day state for a clean slate."""
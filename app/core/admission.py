@@ -0,0 +1,96 @@
+"""Admission control and load shedding for the trade pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+
+from app.core.config import Settings
+
+
+class AdmissionRejected(Exception):
+    """Raised when a trade request is shed instead of being served late."""
+
+    QUEUE_FULL = "queue_full"
+    STALE = "stale"
+    DEADLINE = "deadline"
+
+    def __init__(self, kind: str, message: str) -> None:
+        super().__init__(message)
+        self.kind = kind
+
+
+class AdmissionController:
+    """
+    Bounds in-flight trades and sheds requests whose signal is too old to act on.
+
+    Runs on the event loop, so rejections never occupy a threadpool worker.
+    A request may wait for a slot only while its signal is still fresh.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.max_in_flight = settings.max_inflight_trades
+        self.max_pending = settings.max_pending_trades
+        self.max_signal_age = settings.max_signal_age_ms / 1000.0
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self.in_flight = 0
+        self.pending = 0
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_stale = 0
+        self.shed_deadline = 0
+
+    def remaining_budget(self, signal_time: Optional[datetime]) -> float:
+        """Seconds left before the signal exceeds the maximum tolerated age."""
+        if signal_time is None:
+            return self.max_signal_age
+        if signal_time.tzinfo is not None:
+            signal_time = signal_time.astimezone(timezone.utc).replace(tzinfo=None)
+        age = (datetime.utcnow() - signal_time).total_seconds()
+        return self.max_signal_age - max(age, 0.0)
+
+    @asynccontextmanager
+    async def admit(self, signal_time: Optional[datetime] = None) -> AsyncIterator[None]:
+        """Hold an execution slot for the duration of the block or raise AdmissionRejected."""
+        budget = self.remaining_budget(signal_time)
+        if budget <= 0:
+            self.shed_stale += 1
+            raise AdmissionRejected(AdmissionRejected.STALE, "Signal expired before admission")
+        if not self._slots.locked():
+            await self._slots.acquire()
+        else:
+            if self.pending >= self.max_pending:
+                self.shed_queue_full += 1
+                raise AdmissionRejected(AdmissionRejected.QUEUE_FULL, "Trade queue is full")
+            self.pending += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=budget)
+            except asyncio.TimeoutError:
+                self.shed_deadline += 1
+                raise AdmissionRejected(
+                    AdmissionRejected.DEADLINE, "Signal expired while waiting for capacity"
+                ) from None
+            finally:
+                self.pending -= 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        """Counters for admitted and shed requests."""
+        return {
+            "inFlight": self.in_flight,
+            "pending": self.pending,
+            "admitted": self.admitted,
+            "shedQueueFull": self.shed_queue_full,
+            "shedStale": self.shed_stale,
+            "shedDeadline": self.shed_deadline,
+            "shedTotal": self.shed_queue_full + self.shed_stale + self.shed_deadline,
+        }
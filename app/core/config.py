@@ -1,7 +1,7 @@
 """Application configuration and constants."""
 
 import os
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -38,6 +38,31 @@ class Settings(BaseSettings):
     start_balance_b: float = Field(
         0.0, description="Start-of-day balance for profit vault"
     )
+    max_inflight_trades: int = Field(
+        4, description="Maximum trade requests executing concurrently"
+    )
+    max_pending_trades: int = Field(
+        16, description="Maximum trade requests waiting for an execution slot"
+    )
+    max_signal_age_ms: float = Field(
+        2000.0, description="Signals older than this are shed instead of traded"
+    )
+    idempotency_ttl_seconds: float = Field(
+        300.0, description="How long a trade response is replayed for a repeated idempotency key"
+    )
+    idempotency_max_entries: int = Field(
+        10_000, description="Upper bound on cached trade responses"
+    )
+    idempotency_max_bytes: int = Field(
+        16 * 1024 * 1024,
+        description="Upper bound on cached response bytes (~3k entries of ~5 KB); caps cache memory",
+    )
+    guard_timing_interval: int = Field(
+        100, description="Time each guard rule on every Nth evaluation"
+    )
+    debug_token: Optional[str] = Field(
+        None, description="Shared secret for /debug endpoints; unset disables them"
+    )
     cors_origins: List[str] = Field(
         default_factory=lambda: ["http://localhost:3000"],
         description="Allowed CORS origins for browser-based frontends (comma-separated)",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 class Decision(str, Enum):
@@ -21,4 +22,5 @@ class DecisionResult:
     decision: Decision
     quantity: float = 0.0
     expected_value: float = 0.0
+    reason: Optional[str] = None
 
@@ -0,0 +1,115 @@
+"""Bounded request-dedup cache for idempotent trade submission."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import Settings
+
+# Approximate per-entry bookkeeping (dict slot, tuple, str/bytes headers) on CPython.
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+class IdempotencyCache:
+    """
+    LRU cache of serialized responses with a per-entry TTL and hard ceilings.
+
+    Each entry keeps a fingerprint of the originating request and the response
+    body as bytes. Entries expire ttl seconds after insertion and are swept on
+    every put and stats read via a separate insertion-ordered index (the TTL is fixed, so that
+    order is expiry order); the least recently used ones are evicted once
+    either the entry or the byte budget is exceeded, so memory stays flat at
+    any request rate.
+
+    Lookups do not touch the hit/miss counters; callers record the outcome
+    once they know whether the request was replayed.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.max_entries = settings.idempotency_max_entries
+        self.max_bytes = settings.idempotency_max_bytes
+        self.ttl = settings.idempotency_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str, bytes]]" = OrderedDict()
+        # Same keys in insertion order; never reordered by lookups.
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Return (fingerprint, body) for key, or None if absent or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, fingerprint, body = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return fingerprint, body
+
+    def put(self, key: str, fingerprint: str, body: bytes) -> None:
+        """Store body under key, evicting expired then least recently used entries."""
+        if self._cost(key, fingerprint, body) > self.max_bytes:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (now + self.ttl, fingerprint, body)
+            self._expiry[key] = now + self.ttl
+            self._bytes += self._cost(key, fingerprint, body)
+            self._sweep(now)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        """Hit, miss and eviction counters plus current occupancy."""
+        with self._lock:
+            self._sweep(time.monotonic())
+        return {
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "maxEntries": self.max_entries,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _sweep(self, now: float) -> None:
+        """Drop every expired entry, oldest insertion first."""
+        while self._expiry:
+            oldest_key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._remove(oldest_key)
+            self.expirations += 1
+
+    def _remove(self, key: str) -> None:
+        _, fingerprint, body = self._entries.pop(key)
+        del self._expiry[key]
+        self._bytes -= self._cost(key, fingerprint, body)
+
+    @staticmethod
+    def _cost(key: str, fingerprint: str, body: bytes) -> int:
+        return len(key) + len(fingerprint) + len(body) + _ENTRY_OVERHEAD_BYTES
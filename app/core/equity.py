@@ -0,0 +1,139 @@
+"""Compact equity time series with precomputed min/max resolution levels."""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Each level aggregates LEVEL_FACTOR times more raw points per bucket than the last.
+LEVEL_FACTOR = 16
+LEVEL_COUNT = 5
+
+
+@dataclass
+class EquityCurve:
+    """Columnar equity samples ready for serialization."""
+
+    timestamps: List[float]
+    wallet_a: List[float]
+    wallet_b: List[float]
+    total_points: int
+
+
+class _Level:
+    """Min/max of total equity per fixed-size bucket of raw samples."""
+
+    def __init__(self, bucket_size: int) -> None:
+        self.bucket_size = bucket_size
+        self.min_idx = array("q")
+        self.max_idx = array("q")
+        self.min_val = array("d")
+        self.max_val = array("d")
+
+    def add(self, index: int, value: float) -> None:
+        bucket = index // self.bucket_size
+        if bucket == len(self.min_idx):
+            self.min_idx.append(index)
+            self.max_idx.append(index)
+            self.min_val.append(value)
+            self.max_val.append(value)
+            return
+        if value < self.min_val[bucket]:
+            self.min_idx[bucket] = index
+            self.min_val[bucket] = value
+        if value > self.max_val[bucket]:
+            self.max_idx[bucket] = index
+            self.max_val[bucket] = value
+
+
+class EquitySeries:
+    """
+    Append-only (timestamp, Wallet A, Wallet B) series backed by typed arrays.
+
+    Appends update every resolution level in O(LEVEL_COUNT), so a downsampled
+    view of millions of points only scans a few thousand precomputed buckets.
+    """
+
+    def __init__(self) -> None:
+        self._timestamps = array("d")
+        self._wallet_a = array("d")
+        self._wallet_b = array("d")
+        self._levels = [_Level(LEVEL_FACTOR ** (i + 1)) for i in range(LEVEL_COUNT)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(self, timestamp: float, wallet_a: float, wallet_b: float) -> None:
+        with self._lock:
+            index = len(self._timestamps)
+            self._timestamps.append(timestamp)
+            self._wallet_a.append(wallet_a)
+            self._wallet_b.append(wallet_b)
+            total = wallet_a + wallet_b
+            for level in self._levels:
+                level.add(index, total)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timestamps = array("d")
+            self._wallet_a = array("d")
+            self._wallet_b = array("d")
+            self._levels = [_Level(level.bucket_size) for level in self._levels]
+
+    def downsample(self, max_points: int) -> EquityCurve:
+        """
+        Return at most max_points samples preserving total-equity extremes.
+
+        Uses min/max bucketing over the finest precomputed level that still
+        has enough buckets, merging adjacent buckets to hit the target.
+        """
+        with self._lock:
+            count = len(self._timestamps)
+            if count <= max_points:
+                indices = list(range(count))
+            else:
+                indices = self._extreme_indices(count, max_points)
+            return EquityCurve(
+                timestamps=[self._timestamps[i] for i in indices],
+                wallet_a=[self._wallet_a[i] for i in indices],
+                wallet_b=[self._wallet_b[i] for i in indices],
+                total_points=count,
+            )
+
+    def _extreme_indices(self, count: int, max_points: int) -> List[int]:
+        # First and last samples are always kept; each bucket contributes up to two.
+        if max_points < 4:
+            return [0, count - 1][:max_points]
+        target_buckets = (max_points - 2) // 2
+        level = self._pick_level(count, target_buckets)
+        if level is None:
+            mins = maxs = range(count)
+        else:
+            mins, maxs = level.min_idx, level.max_idx
+        source_buckets = len(mins)
+        group = -(-source_buckets // target_buckets)
+
+        total = self._total_at
+        indices = {0, count - 1}
+        for start in range(0, source_buckets, group):
+            end = min(start + group, source_buckets)
+            lo = min(mins[start:end], key=total)
+            hi = max(maxs[start:end], key=total)
+            indices.add(lo)
+            indices.add(hi)
+        return sorted(indices)
+
+    def _pick_level(self, count: int, target_buckets: int) -> Optional[_Level]:
+        """Coarsest level that still has at least target_buckets buckets."""
+        chosen: Optional[_Level] = None
+        for level in self._levels:
+            if -(-count // level.bucket_size) < target_buckets:
+                break
+            chosen = level
+        return chosen
+
+    def _total_at(self, index: int) -> float:
+        return self._wallet_a[index] + self._wallet_b[index]
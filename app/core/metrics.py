@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Iterable, Optional
 
 from app.core.config import Settings
+from app.core.risk import calculate_net_exposure, win_coverage_ratio
 from app.models.position import Position
 from app.models.trade import Trade
 from app.models.wallet import Wallet
@@ -37,8 +38,8 @@ class MetricsEngine:
         equity_peak: Optional[float],
     ) -> MetricSnapshot:
         """Compute all required metrics."""
-        exposure = self._net_exposure(positions, wallet_a)
-        wcr = self._win_coverage_ratio(trades)
+        exposure = calculate_net_exposure(positions, wallet_a)
+        wcr = win_coverage_ratio(trades)
         dps = self._daily_profit_sufficiency(wallet_a, wallet_b)
         ddv = self._drawdown_velocity(wallet_a, wallet_b, equity_peak)
         return MetricSnapshot(
@@ -48,13 +49,6 @@ class MetricsEngine:
             drawdown_velocity=ddv,
         )
 
-    def _win_coverage_ratio(self, trades: Iterable[Trade]) -> float:
-        wins = sum(1 for t in trades if t.pnl > 0)
-        losses = sum(1 for t in trades if t.pnl < 0)
-        if losses == 0:
-            return float(wins) if wins else 0.0
-        return wins / losses
-
     def _daily_profit_sufficiency(self, wallet_a: Wallet, wallet_b: Wallet) -> float:
         """
         Measures realized profit against a lightweight daily target.
@@ -66,14 +60,6 @@ class MetricsEngine:
             return 0.0
         return wallet_b.balance / target
 
-    def _net_exposure(
-        self, positions: Iterable[Position], wallet_a: Wallet
-    ) -> float:
-        notional = sum(p.notional() for p in positions)
-        if wallet_a.balance <= 0:
-            return 0.0
-        return min(notional / wallet_a.balance, 1.0)
-
     def _drawdown_velocity(
         self, wallet_a: Wallet, wallet_b: Wallet, equity_peak: Optional[float]
     ) -> float:
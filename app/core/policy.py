@@ -0,0 +1,135 @@
+"""Declarative guard rules evaluated as an ordered, short-circuiting pipeline."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(slots=True)
+class GuardInputs:
+    """
+    Values guard rules may read.
+
+    Fields hold floats for a single request or broadcast-compatible NumPy
+    arrays for batch evaluation; rules must stick to operators valid for both.
+    """
+
+    ev: Any
+    price: Any
+    net_exposure: Any
+    win_coverage_ratio: Any
+    balance: Any
+    start_of_day: Any
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named predicate; returning False rejects the trade."""
+
+    name: str
+    check: Callable[[GuardInputs], Any]
+
+
+class PolicyEngine:
+    """
+    Evaluates rules in order and stops at the first rejection.
+
+    Evaluation counts are derived from call and rejection counts, and per-rule
+    timings are only collected on every Nth call, so the hot path is one call
+    per rule plus a single locked counter update.
+    """
+
+    def __init__(self, rules: Sequence[Rule], timing_interval: int = 100) -> None:
+        self.rules = tuple(rules)
+        self.timing_interval = max(1, timing_interval)
+        self._names = tuple(rule.name for rule in self.rules)
+        self._checks = tuple(rule.check for rule in self.rules)
+        self._lock = threading.Lock()
+        self._ticks = itertools.count(1)
+        self.calls = 0
+        self._rejections = [0] * len(self.rules)
+        self._timed_calls = [0] * len(self.rules)
+        self._timed_ns = [0] * len(self.rules)
+
+    def evaluate(self, inputs: GuardInputs) -> Optional[str]:
+        """Return the name of the first failing rule, or None if all pass."""
+        if next(self._ticks) % self.timing_interval == 0:
+            return self._evaluate_timed(inputs)
+
+        failed = -1
+        for index, check in enumerate(self._checks):
+            if not check(inputs):
+                failed = index
+                break
+        with self._lock:
+            self.calls += 1
+            if failed >= 0:
+                self._rejections[failed] += 1
+        return None if failed < 0 else self._names[failed]
+
+    def evaluate_batch(self, inputs: GuardInputs) -> "np.ndarray":
+        """
+        Evaluate every rule over array inputs.
+
+        Returns an array in the inputs' broadcast shape holding the index into
+        `rules` of the first failing rule, or -1 where all rules pass. Batch
+        runs do not touch the live request counters.
+        """
+        import numpy as np
+
+        shape = np.broadcast(*(np.asarray(getattr(inputs, f)) for f in GuardInputs.__slots__)).shape
+        result = np.full(shape, -1, dtype=np.int64)
+        alive = np.ones(shape, dtype=bool)
+        for index, check in enumerate(self._checks):
+            passed = np.broadcast_to(np.asarray(check(inputs), dtype=bool), shape)
+            result[alive & ~passed] = index
+            alive &= passed
+        return result
+
+    def stats(self) -> List[dict]:
+        """Per-rule evaluation and rejection counts with sampled mean timings."""
+        with self._lock:
+            reached = self.calls
+            rejections = list(self._rejections)
+            timed_calls = list(self._timed_calls)
+            timed_ns = list(self._timed_ns)
+        rows: List[dict] = []
+        for index, name in enumerate(self._names):
+            timed = timed_calls[index]
+            rows.append(
+                {
+                    "rule": name,
+                    "evaluations": reached,
+                    "rejections": rejections[index],
+                    "meanMicros": (timed_ns[index] / timed / 1000.0) if timed else 0.0,
+                    "timedSamples": timed,
+                }
+            )
+            reached -= rejections[index]
+        return rows
+
+    def _evaluate_timed(self, inputs: GuardInputs) -> Optional[str]:
+        failed = -1
+        elapsed: List[int] = []
+        for index, check in enumerate(self._checks):
+            start = time.perf_counter_ns()
+            passed = check(inputs)
+            elapsed.append(time.perf_counter_ns() - start)
+            if not passed:
+                failed = index
+                break
+        with self._lock:
+            self.calls += 1
+            if failed >= 0:
+                self._rejections[failed] += 1
+            for index, nanos in enumerate(elapsed):
+                self._timed_calls[index] += 1
+                self._timed_ns[index] += nanos
+        return None if failed < 0 else self._names[failed]
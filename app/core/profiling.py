@@ -0,0 +1,167 @@
+"""On-demand CPU sampling and allocation profiling for live debugging."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from functools import lru_cache
+from types import CodeType, FrameType
+from typing import Dict, List, Optional, Tuple
+
+_session_lock = threading.Lock()
+
+# Frames kept per allocation so library allocations can be charged to app code.
+ALLOC_TRACE_FRAMES = 16
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+# Leaf frames of threads parked waiting for work; they carry no CPU cost.
+IDLE_LEAVES = frozenset(
+    {
+        "selectors:_PollLikeSelector.select",
+        "selectors:EpollSelector.select",
+        "selectors:KqueueSelector.select",
+        "selectors:PollSelector.select",
+        "selectors:DevpollSelector.select",
+        "selectors:SelectSelector.select",
+        "threading:Condition.wait",
+        "threading:Event.wait",
+        "threading:Thread._wait_for_tstate_lock",
+        "queue:Queue.get",
+    }
+)
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profiling session is already running."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    labels: List[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_cpu(seconds: float, interval: float, idle: bool = False) -> Dict[str, int]:
+    """
+    Sample the stacks of all other threads for the given duration.
+
+    Returns collapsed stacks (root first, ';'-separated) mapped to sample counts.
+    Threads blocked in an IDLE_LEAVES frame are dropped unless idle is True, so
+    the result approximates on-CPU time rather than wall-clock time.
+    Nothing is installed outside the session, so there is no idle overhead.
+    """
+    if not _session_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profiling session is already running")
+    try:
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if not idle and _frame_label(frame) in IDLE_LEAVES:
+                    continue
+                stacks[_collapse(frame)] += 1
+            time.sleep(interval)
+        return dict(stacks)
+    finally:
+        _session_lock.release()
+
+
+def format_collapsed(stacks: Dict[str, int]) -> str:
+    """Render stacks in the collapsed format consumed by flamegraph.pl/speedscope."""
+    lines = [f"{stack} {count}" for stack, count in sorted(stacks.items(), key=lambda kv: -kv[1])]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def snapshot_allocations(seconds: float, top: int) -> List[dict]:
+    """
+    Trace allocations for the given duration and return the largest sites.
+
+    Each site pairs the innermost app frame with the allocating leaf frame, so
+    allocations inside libraries are charged to the app function calling them.
+    Tracing is only enabled for the session unless it was already on at startup.
+    """
+    if not _session_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profiling session is already running")
+    was_tracing = tracemalloc.is_tracing()
+    try:
+        if not was_tracing:
+            tracemalloc.start(ALLOC_TRACE_FRAMES)
+        baseline = tracemalloc.take_snapshot()
+        time.sleep(seconds)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        _session_lock.release()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = snapshot.filter_traces(filters).compare_to(baseline.filter_traces(filters), "traceback")
+    sites: Dict[Tuple[Optional[tracemalloc.Frame], tracemalloc.Frame], List[int]] = {}
+    for stat in stats:
+        leaf = stat.traceback[-1]
+        app_frame = next((f for f in reversed(stat.traceback) if f.filename.startswith(_APP_ROOT)), None)
+        totals = sites.setdefault((app_frame, leaf), [0, 0, 0, 0])
+        totals[0] += stat.size
+        totals[1] += stat.size_diff
+        totals[2] += stat.count
+        totals[3] += stat.count_diff
+
+    ranked = sorted(sites.items(), key=lambda item: -item[1][1])[:top]
+    rows: List[dict] = []
+    for (app_frame, leaf), (size, size_diff, count, count_diff) in ranked:
+        rows.append(
+            {
+                "function": _qualname_at(app_frame.filename, app_frame.lineno) if app_frame else None,
+                "location": f"{app_frame.filename}:{app_frame.lineno}" if app_frame else None,
+                "leafFunction": _qualname_at(leaf.filename, leaf.lineno),
+                "leafLocation": f"{leaf.filename}:{leaf.lineno}",
+                "sizeBytes": size,
+                "sizeDiffBytes": size_diff,
+                "count": count,
+                "countDiff": count_diff,
+            }
+        )
+    return rows
+
+
+@lru_cache(maxsize=256)
+def _code_ranges(filename: str) -> Tuple[Tuple[int, int, str], ...]:
+    """Line spans of every function defined in a source file."""
+    try:
+        with open(filename, "r", encoding="utf-8") as handle:
+            root = compile(handle.read(), filename, "exec")
+    except (OSError, SyntaxError, ValueError):
+        return ()
+    ranges: List[Tuple[int, int, str]] = []
+    pending: List[CodeType] = [root]
+    while pending:
+        code = pending.pop()
+        lines = [line for _, _, line in code.co_lines() if line is not None]
+        if lines and code is not root:
+            ranges.append((min(lines), max(lines), getattr(code, "co_qualname", code.co_name)))
+        pending.extend(c for c in code.co_consts if isinstance(c, CodeType))
+    return tuple(ranges)
+
+
+def _qualname_at(filename: str, lineno: int) -> str:
+    """Innermost function enclosing a line, or '<module>' for top-level code."""
+    best: Optional[Tuple[int, int, str]] = None
+    for start, end, name in _code_ranges(filename):
+        if start <= lineno <= end and (best is None or end - start < best[1] - best[0]):
+            best = (start, end, name)
+    return best[2] if best else "<module>"
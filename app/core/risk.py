@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 from app.models.position import Position
 from app.models.trade import Trade
@@ -30,14 +30,16 @@ def win_coverage_ratio(trades: Iterable[Trade]) -> float:
     return wins / losses
 
 
-def can_risk(wallet: Wallet, risk_fraction: float, estimated_loss_pct: float) -> bool:
+def within_risk_budget(
+    balance: Any, start_of_day: Any, risk_fraction: float, estimated_loss_pct: float
+) -> Any:
     """
     Determine if a trade is permitted under wallet floor constraints.
 
     The maximum tolerated loss is capped so Wallet A never drops below its floor.
+    Accepts floats or NumPy arrays.
     """
-    risk_budget = wallet.start_of_day * risk_fraction
-    floor_after_loss = wallet.balance - risk_budget
-    projected_loss = wallet.balance * estimated_loss_pct
-    return floor_after_loss >= wallet.start_of_day and projected_loss <= risk_budget
-
+    risk_budget = start_of_day * risk_fraction
+    floor_after_loss = balance - risk_budget
+    projected_loss = balance * estimated_loss_pct
+    return (floor_after_loss >= start_of_day) & (projected_loss <= risk_budget)
@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
+from typing import List, Optional
+
 from app.core.config import Settings
 from app.core.decision import Decision, DecisionResult
 from app.core.metrics import MetricSnapshot
-from app.core.risk import can_risk
+from app.core.policy import GuardInputs, PolicyEngine, Rule
+from app.core.risk import within_risk_budget
 from app.engine.executor import ExecutionEngine
 
 
+def guard_rules(settings: Settings) -> List[Rule]:
+    """Trade gates in evaluation order; each works on scalar and array inputs."""
+    exposure_limit = settings.exposure_limit
+    min_wcr = settings.min_wcr
+    risk_fraction = settings.max_risk_per_trade
+    loss_pct = settings.expected_loss_pct
+    return [
+        Rule("positive_ev", lambda c: c.ev > 0),
+        Rule("exposure_limit", lambda c: c.net_exposure < exposure_limit),
+        Rule(
+            "min_wcr",
+            lambda c: (c.win_coverage_ratio >= min_wcr) | (c.win_coverage_ratio == 0),
+        ),
+        Rule(
+            "wallet_floor",
+            lambda c: within_risk_budget(c.balance, c.start_of_day, risk_fraction, loss_pct),
+        ),
+        Rule("positive_price", lambda c: c.price > 0),
+    ]
+
+
 class DemoStrategy:
     """Evaluates trade conditions and triggers mock execution."""
 
     def __init__(self, executor: ExecutionEngine, settings: Settings) -> None:
         self.executor = executor
         self.settings = settings
+        self.policy = PolicyEngine(guard_rules(settings), timing_interval=settings.guard_timing_interval)
 
     def run(
         self, price: float, probability: float, metrics: MetricSnapshot
@@ -28,28 +53,27 @@ class DemoStrategy:
         loss_pct = self.settings.expected_loss_pct
         ev = (probability * gain_pct - (1 - probability) * loss_pct) * price
 
-        if not self._guards(ev, metrics, price):
+        rejected_by = self._guards(ev, metrics, price)
+        if rejected_by is not None:
             return DecisionResult(
                 decision=Decision.NO_TRADE,
                 quantity=0.0,
                 expected_value=ev,
+                reason=rejected_by,
             )
 
         return self.executor.build_decision(ev, price, probability)
 
-    def _guards(self, ev: float, metrics: MetricSnapshot, price: float) -> bool:
-        """Apply risk and performance gates."""
-        if ev <= 0:
-            return False
-        if metrics.net_exposure >= self.settings.exposure_limit:
-            return False
-        if metrics.win_coverage_ratio < self.settings.min_wcr and metrics.win_coverage_ratio != 0:
-            return False
-        if not can_risk(
-            wallet=self.executor.state.wallet_a,
-            risk_fraction=self.settings.max_risk_per_trade,
-            estimated_loss_pct=self.settings.expected_loss_pct,
-        ):
-            return False
-        return price > 0
-
+    def _guards(self, ev: float, metrics: MetricSnapshot, price: float) -> Optional[str]:
+        """Apply risk and performance gates; return the rejecting rule name, if any."""
+        wallet = self.executor.state.wallet_a
+        return self.policy.evaluate(
+            GuardInputs(
+                ev=ev,
+                price=price,
+                net_exposure=metrics.net_exposure,
+                win_coverage_ratio=metrics.win_coverage_ratio,
+                balance=wallet.balance,
+                start_of_day=wallet.start_of_day,
+            )
+        )
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Tuple
 
 from app.core.config import Settings
 from app.core.decision import Decision, DecisionResult
+from app.core.equity import EquitySeries
 from app.engine.allocator import allocate_quantity
 from app.models.position import Position
 from app.models.trade import Trade
@@ -23,9 +24,15 @@ class PortfolioState:
     positions: List[Position] = field(default_factory=list)
     trades: List[Trade] = field(default_factory=list)
     equity_peak: float | None = None
+    equity_curve: EquitySeries = field(default_factory=EquitySeries)
 
     def record_trade(self, trade: Trade) -> None:
         self.trades.append(trade)
+        self.equity_curve.append(
+            trade.timestamp.replace(tzinfo=timezone.utc).timestamp(),
+            self.wallet_a.balance,
+            self.wallet_b.balance,
+        )
         equity = self.wallet_a.balance + self.wallet_b.balance
         if self.equity_peak is None or equity > self.equity_peak:
             self.equity_peak = equity
@@ -35,6 +42,7 @@ class PortfolioState:
         self.wallet_b.reset_day(settings.start_balance_b)
         self.positions.clear()
         self.trades.clear()
+        self.equity_curve.clear()
         self.equity_peak = self.wallet_a.balance + self.wallet_b.balance
 
 